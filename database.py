@@ -1,339 +1,641 @@
+"""Module containing the CroDynO cross section database.
+
+Notes
+-----
+Each dictionary collects the fits for the production or destruction of a
+given species in a H2 target. Fits are stored as `(class_name, args)` tuples
+and are only instantiated on first access (see `LazyFitDict`). The
+descriptions of the reactions of each dictionary are also available, without
+building any fit, from the read-only mapping with the same name and the `_doc`
+suffix (e.g. `Hp_from_H2_target_doc`). All dictionaries are registered in
+`DB`, indexed by product species (e.g. `DB['Hp']` is `Hp_from_H2_target`). The
+parameters of all fits are additionally gathered per fit class in the
+`fit_blocks` structure of arrays, which `evaluate_rows` and `evaluate_all`
+use to evaluate many reactions at once without building any fit object, while
+`preload` builds every fit up front for jobs sensitive to start-up latency.
+Finally, every reaction is numbered by the `Reaction` integer enumeration,
+which indexes the flat `reaction_*` arrays, for code that cannot afford
+string lookups (e.g. Monte Carlo inner loops).
+
+"""
+import sys
+from collections.abc import MutableMapping
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple
+import numpy as np
 import fitclasses as ftc
 
-Hp_from_H2_target = {
+
+class LazyFitDict(MutableMapping):
+    """Dictionary of cross section fits instantiated on first access.
+
+    Notes
+    -----
+    Values are stored as `(class_name, args)` tuples, where `class_name` is
+    the name of a `CrossSectionFit` subclass in the `fitclasses.py` module and
+    `args` are the positional arguments of its constructor. The fit object is
+    built the first time its key is accessed and then stored in place of the
+    tuple, so that the import of this module does not pay for the
+    construction of unused fits. Every accessor of the mapping (e.g.
+    `values`, `items`, `pop` or `copy`) goes through that lookup, so that
+    only fit objects are ever handed out. Keys are interned, so that lookups
+    with the same reaction name compare by identity.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._entries = {sys.intern(key): value
+                         for key, value in dict(*args, **kwargs).items()}
+
+    def __getitem__(self, key):
+        value = self._entries[key]
+        # Build the fit and store it back if it has not been accessed yet
+        if isinstance(value, tuple):
+            class_name, args = value
+            value = getattr(ftc, class_name)(*args)
+            self._entries[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._entries[sys.intern(key)] = value
+
+    def __delitem__(self, key):
+        del self._entries[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        # Membership must not build the fit, as the inherited test would
+        return key in self._entries
+
+    def copy(self):
+        # Shallow copy as a plain dictionary of fits, like dict.copy
+        return dict(self.items())
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.copy()!r})'
+
+
+Hp_from_H2_target = LazyFitDict({
     'H + H2 -> total fast H+':
-    ftc.TabataFit2((5.62e1, 1.12e5), 'Total H+ production from H + H2.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 4.7%.',
-                   (2.0e1, 2.53e-4, 1.728, 2.164, 7.74e-1, 1.639, 1.43e1)),
+    ('TabataFit2', ((5.62e1, 1.12e5), 'Total H+ production from H + H2.\n'
+                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
+                    'Notes: none.'
+                    'RMS: 4.7%.',
+                    (2.0e1, 2.53e-4, 1.728, 2.164, 7.74e-1, 1.639, 1.43e1))),
 
     'H- + H2 -> total fast H+':
-    ftc.TabataFit6((1.00e3, 3.00e5), 'Total H+ production from H- + H2.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 9.0%.',
-                   (0.0, 1.75e-8, 3.88, 9.06e-1, -2.74e-1, 3.19, 1.19)),
+    ('TabataFit6', ((1.00e3, 3.00e5), 'Total H+ production from H- + H2.\n'
+                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
+                    'Notes: none.'
+                    'RMS: 9.0%.',
+                    (0.0, 1.75e-8, 3.88, 9.06e-1, -2.74e-1, 3.19, 1.19))),
 
     'H2+ + H2 -> total fast H+ low energy':
-    ftc.BarnettChebFit((1.6, 5.0), 'Total H+ production from H2+ + H2 at low'
-                       ' energies.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: No attempt has been made to interpolate between'
-                       ' the low-energy data and the data taken at higher'
-                       ' energiesi.\n'
-                       'Accuracy: 25%.',
-                       2,
-                       (-74.4493, .351878, -.249279, .0781924, -.0295527,
-                        .00853617, -.00490330)),
+    ('BarnettChebFit', ((1.6, 5.0), 'Total H+ production from H2+ + H2 at low'
+                        ' energies.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: No attempt has been made to interpolate'
+                        ' between the low-energy data and the data taken at'
+                        ' higher energiesi.\n'
+                        'Accuracy: 25%.',
+                        2,
+                        (-74.4493, .351878, -.249279, .0781924, -.0295527,
+                         .00853617, -.00490330))),
 
     'H2+ + H2 -> total fast H+ high energy':
-    ftc.BarnettChebFit((1.5e3, 1.0e7), 'Total H+ production from H2+ + H2 at'
-                       ' high energies.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: No attempt has been made to interpolate between'
-                       ' the low-energy data and the data taken at higher'
-                       ' energies.\n'
-                       'Accuracy: 25%.',
-                       2,
-                       (-74.9261, -2.19443, -.855834, .0421307, .216227,
-                        .0921147, -.0893079)),
+    ('BarnettChebFit', ((1.5e3, 1.0e7), 'Total H+ production from H2+ + H2 at'
+                        ' high energies.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: No attempt has been made to interpolate'
+                        ' between the low-energy data and the data taken at'
+                        ' higher energies.\n'
+                        'Accuracy: 25%.',
+                        2,
+                        (-74.9261, -2.19443, -.855834, .0421307, .216227,
+                         .0921147, -.0893079))),
 
     'H2 + H2 -> total fast H+ low energy':
-    ftc.BarnettChebFit((2.5e3, 5.0e4), 'Total H+ production from H2 + H2 at'
-                       ' low energies.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: This data involves the sum of the cross'
-                       ' sections for the products: σ(H+ + H)proj + 2σ(H+ +'
-                       ' H+)proj + σ(H+ + H-). No attempt has been made to'
-                       ' join the high and low energy data sets.\n'
-                       'Accuracy: Unknown.',
-                       2,
-                       (-75.7161, .371301, -.373363, -.209805, -.0677263,
-                        -.00389719, .0259767)),
+    ('BarnettChebFit', ((2.5e3, 5.0e4), 'Total H+ production from H2 + H2 at'
+                        ' low energies.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: This data involves the sum of the cross'
+                        ' sections for the products: σ(H+ + H)proj + 2σ(H+ +'
+                        ' H+)proj + σ(H+ + H-). No attempt has been made to'
+                        ' join the high and low energy data sets.\n'
+                        'Accuracy: Unknown.',
+                        2,
+                        (-75.7161, .371301, -.373363, -.209805, -.0677263,
+                         -.00389719, .0259767))),
 
     'H2 + H2 -> total fast H+ high energy':
-    ftc.BarnettChebFit((1.5e5, 6.0e5), 'Total H+ production from H2 + H2 at'
-                       ' high energies.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: This data involves the sum of the cross'
-                       ' sections for the products: σ(H+ + H)proj + 2σ(H+ +'
-                       ' H+)proj + σ(H+ + H-). No attempt has been made to'
-                       ' join the high and low energy data sets.\n'
-                       'Accuracy: Unknown.',
-                       2,
-                       (-75.8616, -.542987, .0642733, .0118753, -.00148111,
-                        .000221649, .00636358)),
+    ('BarnettChebFit', ((1.5e5, 6.0e5), 'Total H+ production from H2 + H2 at'
+                        ' high energies.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: This data involves the sum of the cross'
+                        ' sections for the products: σ(H+ + H)proj + 2σ(H+ +'
+                        ' H+)proj + σ(H+ + H-). No attempt has been made to'
+                        ' join the high and low energy data sets.\n'
+                        'Accuracy: Unknown.',
+                        2,
+                        (-75.8616, -.542987, .0642733, .0118753, -.00148111,
+                         .000221649, .00636358))),
 
     'H3+ + H2 -> total fast H+':
-    ftc.BarnettChebFit((4.0e1, 6.0e5), 'Total H+ production from H3+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: Large variations in measured dissociation cross'
-                       ' sections have been ascribed to the influence of H3+'
-                       ' ions formed in ion sources with varying degree of'
-                       ' vibrational excitation.\n'
-                       'Accuracy: 30%.',
-                       3,
-                       (-75.3369, 1.74367, -.759749, -.559135, .0918355,
-                        .0438106, -.0940811)),
-}
+    ('BarnettChebFit', ((4.0e1, 6.0e5), 'Total H+ production from H3+ + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: Large variations in measured dissociation'
+                        ' cross sections have been ascribed to the influence'
+                        ' of H3+ ions formed in ion sources with varying'
+                        ' degree of vibrational excitation.\n'
+                        'Accuracy: 30%.',
+                        3,
+                        (-75.3369, 1.74367, -.759749, -.559135, .0918355,
+                         .0438106, -.0940811))),
+})
 
-H_from_H2_target = {
+H_from_H2_target = LazyFitDict({
     'H+ + H2 -> total fast H':
-    ftc.TabataFit8((3.16, 1.00e5), 'Total H production from H+ + H2.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 1.3%.',
-                   (2.5, 2.12e2, 1.721, 6.7e-4, 3.239e-1, 4.34e-3, 1.296,
-                    1.42e-1, 9.34, 2.997)),
-
-    'H- + H2 -> total fast H':
-    ftc.TabataFit11((2.37, 5.00e4), 'Total H production from H- + H2.\n'
+    ('TabataFit8', ((3.16, 1.00e5), 'Total H production from H+ + H2.\n'
                     'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                    ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                    ' Tabata.\n'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
                     'Notes: none.'
-                    'RMS: 6.4%.',
-                    (2.25, 4.19e-2, 1.89, 1.78e-1, -2.3e-1, 1.04, 8.7e-1,
-                     1.65e1, 1.088, 5.33e-3, 1.66e-1)),
+                    'RMS: 1.3%.',
+                    (2.5, 2.12e2, 1.721, 6.7e-4, 3.239e-1, 4.34e-3, 1.296,
+                     1.42e-1, 9.34, 2.997))),
+
+    'H- + H2 -> total fast H':
+    ('TabataFit11', ((2.37, 5.00e4), 'Total H production from H- + H2.\n'
+                     'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                     ' 17, Atomic and Molecular Collision Cross Section (2).'
+                     ' T. Tabata.\n'
+                     'Notes: none.'
+                     'RMS: 6.4%.',
+                     (2.25, 4.19e-2, 1.89, 1.78e-1, -2.3e-1, 1.04, 8.7e-1,
+                      1.65e1, 1.088, 5.33e-3, 1.66e-1))),
 
     'H2+ + H2 -> total fast H':
-    ftc.BarnettChebFit((2.0e3, 1.0e5), 'Total H production from H2+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: The data refer to the sum of the cross section'
-                       ' for H2+ + H2 -> (H+ + H)proj  and H2+ + H2 -> (H +'
-                       ' H)proj.\n'
-                       'Accuracy: 20%.',
-                       2,
-                       (-70.6702, -.632612, -.606521, -.0915143, -.0121710,
-                        .0168179, .0104797)),
+    ('BarnettChebFit', ((2.0e3, 1.0e5), 'Total H production from H2+ + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: The data refer to the sum of the cross'
+                        ' section for H2+ + H2 -> (H+ + H)proj  and H2+ + H2'
+                        ' -> (H + H)proj.\n'
+                        'Accuracy: 20%.',
+                        2,
+                        (-70.6702, -.632612, -.606521, -.0915143, -.0121710,
+                         .0168179, .0104797))),
 
     'H2 + H2 -> total fast H':
-    ftc.BarnettChebFit((2.5e3, 5.0e4), 'Total H production from H2 + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: This data involves the sum of the cross'
-                       ' sections for the products: σ(H+ + H)proj + 2σ(H +'
-                       ' H)proj. Variations in ion source conditions produce'
-                       ' changes up to 10% in the measured values.\n'
-                       'Accuracy: 40%.',
-                       2,
-                       (-71.7329, -.200109, -.223241, -.0773361, -.0140887,
-                        .0563185, -.00955263)),
+    ('BarnettChebFit', ((2.5e3, 5.0e4), 'Total H production from H2 + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: This data involves the sum of the cross'
+                        ' sections for the products: σ(H+ + H)proj + 2σ(H +'
+                        ' H)proj. Variations in ion source conditions produce'
+                        ' changes up to 10% in the measured values.\n'
+                        'Accuracy: 40%.',
+                        2,
+                        (-71.7329, -.200109, -.223241, -.0773361, -.0140887,
+                         .0563185, -.00955263))),
 
     'H3+ + H2 -> total fast H':
-    ftc.BarnettChebFit((1.5e3, 6.0e5), 'Total H production from H3+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: Large variations in measured dissociation cross'
-                       ' sections have been ascribed to the influence of H3+'
-                       ' ion sources with varying degree of vibrational'
-                       ' excitation.\n'
-                       'Accuracy: 30%.',
-                       3,
-                       (-71.5391, -1.05347, -.826342, .203507, .0536140,
-                        -.0425785, -.0185315)),
-}
+    ('BarnettChebFit', ((1.5e3, 6.0e5), 'Total H production from H3+ + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: Large variations in measured dissociation'
+                        ' cross sections have been ascribed to the influence'
+                        ' of H3+ ion sources with varying degree of'
+                        ' vibrational excitation.\n'
+                        'Accuracy: 30%.',
+                        3,
+                        (-71.5391, -1.05347, -.826342, .203507, .0536140,
+                         -.0425785, -.0185315))),
+})
 
-Hm_from_H2_target = {
+Hm_from_H2_target = LazyFitDict({
     'H+ + H2 -> total fast H-':
-    ftc.BarnettChebFit((2.0e2, 1.0e6), 'Total H- production from H+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: none.\n'
-                       'Accuracy: 25% for energy < 1e4, 15% for energy < 1e5,'
-                       ' 40% for energy > 1e5.',
-                       1,
-                       (-95.8165, -7.17049, -7.48288, -1.93034, .761153,
-                        .556689, -.0542859, -.270184, -.0147551)),
+    ('BarnettChebFit', ((2.0e2, 1.0e6), 'Total H- production from H+ + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: none.\n'
+                        'Accuracy: 25% for energy < 1e4, 15% for energy <'
+                        ' 1e5, 40% for energy > 1e5.',
+                        1,
+                        (-95.8165, -7.17049, -7.48288, -1.93034, .761153,
+                         .556689, -.0542859, -.270184, -.0147551))),
 
     'H + H2 -> total fast H-':
-    ftc.TabataFit13((2.37e1, 9.11e4), 'Total H- production from H + H2.\n'
-                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                    ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                    ' Tabata.\n'
-                    'Notes: none'
-                    'RMS: 3.6%.',
-                    (2.1e1, 9.73e-3, 2.38, 1.39e-2, -5.51e-1, 7.7e-2, 2.12,
-                     1.97e-6, 2.051, 5.5, 6.62e-1, 2.02e1, 3.62)),
-}
+    ('TabataFit13', ((2.37e1, 9.11e4), 'Total H- production from H + H2.\n'
+                     'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                     ' 17, Atomic and Molecular Collision Cross Section (2).'
+                     ' T. Tabata.\n'
+                     'Notes: none'
+                     'RMS: 3.6%.',
+                     (2.1e1, 9.73e-3, 2.38, 1.39e-2, -5.51e-1, 7.7e-2, 2.12,
+                      1.97e-6, 2.051, 5.5, 6.62e-1, 2.02e1, 3.62))),
+})
 
-H2p_from_H2_target = {
+H2p_from_H2_target = LazyFitDict({
     'H2+ + H2 -> total H2+ destruction':
-    ftc.BarnettChebFit((1.3e3, 5.0e4), 'Total H2+ destruction from H2+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: This cross section is the sum of cross sections'
-                       ' for all reactions that destroy the fast H2+ molecular'
-                       ' ion in passage through H2. Large variations in ion'
-                       ' source operating conditions were found to produce'
-                       ' changes up to 10% in the measured cross section\n'
-                       'Accuracy: 20%.',
-                       2,
-                       (-69.7995, -.288081, -.216489, -.102343, -.0344599,
-                        .0155290, .0223268)),
+    ('BarnettChebFit', ((1.3e3, 5.0e4), 'Total H2+ destruction from H2+ +'
+                        ' H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: This cross section is the sum of cross'
+                        ' sections for all reactions that destroy the fast'
+                        ' H2+ molecular ion in passage through H2. Large'
+                        ' variations in ion source operating conditions were'
+                        ' found to produce changes up to 10% in the measured'
+                        ' cross section\n'
+                        'Accuracy: 20%.',
+                        2,
+                        (-69.7995, -.288081, -.216489, -.102343, -.0344599,
+                         .0155290, .0223268))),
 
     'H2 + H2 -> total fast H2+':
-    ftc.TabataFit10((4.21e1, 9.90e4), 'Total H2+ production from H2 + H2.\n'
-                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                    ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                    ' Tabata.\n'
-                    'Notes: none.'
-                    'RMS: 3.4%.',
-                    (3.2e1, 1.879e-3, 2.497, 6.62e-2, -4.67e-1, 3.58e-1,
-                     5.0e-1, 7.67, 2.01e+2)),
+    ('TabataFit10', ((4.21e1, 9.90e4), 'Total H2+ production from H2 + H2.\n'
+                     'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                     ' 17, Atomic and Molecular Collision Cross Section (2).'
+                     ' T. Tabata.\n'
+                     'Notes: none.'
+                     'RMS: 3.4%.',
+                     (3.2e1, 1.879e-3, 2.497, 6.62e-2, -4.67e-1, 3.58e-1,
+                      5.0e-1, 7.67, 2.01e+2))),
 
     'H3+ + H2 -> total fast H2+':
-    ftc.BarnettChebFit((1.1e2, 6.0e5), 'Total H2+ production from H3+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: Large variations in measured dissociation cross'
-                       ' sections have been ascribed to the influence of H3+'
-                       ' ion sources with varying degree of vibrational'
-                       ' excitation.\n'
-                       'Accuracy: 30%.',
-                       3,
-                       (-75.4231, .295854, -.985779, -.0762360, .0980699,
-                        -.0248092, -.0512818)),
-}
+    ('BarnettChebFit', ((1.1e2, 6.0e5), 'Total H2+ production from H3+ +'
+                        ' H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: Large variations in measured dissociation'
+                        ' cross sections have been ascribed to the influence'
+                        ' of H3+ ion sources with varying degree of'
+                        ' vibrational excitation.\n'
+                        'Accuracy: 30%.',
+                        3,
+                        (-75.4231, .295854, -.985779, -.0762360, .0980699,
+                         -.0248092, -.0512818))),
+})
 
-H2_from_H2_target = {
+H2_from_H2_target = LazyFitDict({
     'H2 + H2 -> total H2 destruction':
-    ftc.BarnettChebFit((1.3e3, 5.0e4), 'Total H2 destruction from H2 + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: This cross section is the sum of cross sections'
-                       ' for all reactions that destroy the fast H2 molecule'
-                       ' in passage through H2, i.e. those producing fast H2+,'
-                       ' (H + H), (H + H+) and (H+ + H+) products. Large'
-                       ' variations in ion source operating conditions were'
-                       ' found to produce changes up to 10% in the measured'
-                       ' cross section.\n'
-                       'Accuracy: 20%.',
-                       2,
-                       (-71.8671, .380700, -.137630, -.0886297, -.00459765,
-                        .0134628, .00197498)),
+    ('BarnettChebFit', ((1.3e3, 5.0e4), 'Total H2 destruction from H2 + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: This cross section is the sum of cross'
+                        ' sections for all reactions that destroy the fast H2'
+                        ' molecule in passage through H2, i.e. those'
+                        ' producing fast H2+, (H + H), (H + H+) and (H+ + H+)'
+                        ' products. Large variations in ion source operating'
+                        ' conditions were found to produce changes up to 10%'
+                        ' in the measured cross section.\n'
+                        'Accuracy: 20%.',
+                        2,
+                        (-71.8671, .380700, -.137630, -.0886297, -.00459765,
+                         .0134628, .00197498))),
 
     'H+ + H2 -> H2 momentum transfer':
-    ftc.TabataFit1((1.00e-1, 1.00e4), 'H2 production from H+ + H2 due to'
-                   ' momentum transfer.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 4.9%.',
-                   (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737)),
+    ('TabataFit1', ((1.00e-1, 1.00e4), 'H2 production from H+ + H2 due to'
+                    ' momentum transfer.\n'
+                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
+                    'Notes: none.'
+                    'RMS: 4.9%.',
+                    (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))),
 
     'H + H2 -> H2 momentum transfer':
-    ftc.TabataFit6((1.00e-1, 1.00e4), 'H2 production from H- + H2 due to'
-                   ' momentum transfer.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 2.6%.',
-                   (0.0, 6.36, -3.37e-1, 5.5e-3, 8.3e-1, 2.6e-2, 1.766)),
+    ('TabataFit6', ((1.00e-1, 1.00e4), 'H2 production from H- + H2 due to'
+                    ' momentum transfer.\n'
+                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
+                    'Notes: none.'
+                    'RMS: 2.6%.',
+                    (0.0, 6.36, -3.37e-1, 5.5e-3, 8.3e-1, 2.6e-2, 1.766))),
 
     'H- + H2 -> H2 momentum transfer':
-    ftc.TabataFit6((1.00e-1, 1.00e4), 'H2 production from H + H2 due to'
-                   ' momentum transfer.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 1.5%.',
-                   (0.0, 2.97e1, 4.095e-3, 1.11e-4, 5.55e-1, 6.0e-3, 1.607)),
+    ('TabataFit6', ((1.00e-1, 1.00e4), 'H2 production from H + H2 due to'
+                    ' momentum transfer.\n'
+                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
+                    'Notes: none.'
+                    'RMS: 1.5%.',
+                    (0.0, 2.97e1, 4.095e-3, 1.11e-4, 5.55e-1, 6.0e-3, 1.607))),
 
     'H2+ + H2 -> fast H2 charge exchange':
-    ftc.BarnettChebFit((2.0, 1.0e5), 'H2 production from H2+ + H2 due to'
-                       ' charge exchange.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: It is well known that the H2+ electron capture'
-                       ' cross sections are dependent on the vibrational'
-                       ' levels of the H2+ ion. The effect increases as the'
-                       ' energy decreases.\n'
-                       'Accuracy: 30% for energy < 2e3, 20% for energy > 2e3.',
-                       2,
-                       (-71.4572, -1.88878, -.906965, -.676593, -.388666,
-                        -.0528444, .0283239, -.0386419, .00767518)),
+    ('BarnettChebFit', ((2.0, 1.0e5), 'H2 production from H2+ + H2 due to'
+                        ' charge exchange.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: It is well known that the H2+ electron'
+                        ' capture cross sections are dependent on the'
+                        ' vibrational levels of the H2+ ion. The effect'
+                        ' increases as the energy decreases.\n'
+                        'Accuracy: 30% for energy < 2e3, 20% for energy >'
+                        ' 2e3.',
+                        2,
+                        (-71.4572, -1.88878, -.906965, -.676593, -.388666,
+                         -.0528444, .0283239, -.0386419, .00767518))),
 
     'H3+ + H2 -> H2 momentum transfer':
-    ftc.TabataFit14((1.00e-1, 1.00e4), 'H2 production from H3+ + H2 due to'
-                    ' momentum transfer.\n'
-                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                    ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                    ' Tabata.\n'
-                    'Notes: none.'
-                    'RMS: 5.6%.',
-                    (0.0, 1.16, -8.12e-1, 4.29e-4, -1.38e-1, 1.28e-2, 1.33,
-                     8.67e-2, 2.18)),
+    ('TabataFit14', ((1.00e-1, 1.00e4), 'H2 production from H3+ + H2 due to'
+                     ' momentum transfer.\n'
+                     'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                     ' 17, Atomic and Molecular Collision Cross Section (2).'
+                     ' T. Tabata.\n'
+                     'Notes: none.'
+                     'RMS: 5.6%.',
+                     (0.0, 1.16, -8.12e-1, 4.29e-4, -1.38e-1, 1.28e-2, 1.33,
+                      8.67e-2, 2.18))),
 
     'H3+ + H2 -> total fast H2':
-    ftc.BarnettChebFit((3.0e1, 6.0e5), 'Total H2 production from H3+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: Large variations in measured dissociation cross'
-                       ' sections have been ascribed to the influence of H3+'
-                       ' ion sources with varying degree of vibrational'
-                       ' excitation.\n'
-                       'Accuracy: 30%.',
-                       3,
-                       (-74.8168, -.899995, -1.57067, -.379862, .384429,
-                        .264557, .0263143)),
-}
+    ('BarnettChebFit', ((3.0e1, 6.0e5), 'Total H2 production from H3+ + H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: Large variations in measured dissociation'
+                        ' cross sections have been ascribed to the influence'
+                        ' of H3+ ion sources with varying degree of'
+                        ' vibrational excitation.\n'
+                        'Accuracy: 30%.',
+                        3,
+                        (-74.8168, -.899995, -1.57067, -.379862, .384429,
+                         .264557, .0263143))),
+})
 
-H3p_from_H2_target = {
+H3p_from_H2_target = LazyFitDict({
     'H3+ + H2 -> total H3+ destruction':
-    ftc.BarnettChebFit((1.6e3, 3.5e4), 'Total H3+ destruction from H3+ + H2.\n'
-                       'Reference: ATOMIC DATA FOR FUSION VOLUME 1 COLLISIONS'
-                       ' OF H, H2, He and Li ATOMS and IONS with ATOMS and'
-                       ' MOLECULES. C. F. Barnett.\n'
-                       'Notes: This corss section is the sum of cross sections'
-                       ' for all reactions that destroy the H3+ molecular ion'
-                       ' in passage through H2. Large variations in ion source'
-                       ' operating conditions were found to produce changes up'
-                       ' to 10% in the measured cross sections.\n'
-                       'Accuracy: 20%.',
-                       3,
-                       (-70.3701, .284601, -.184305, -.0425670, -.00921848,
-                        .00921848, .00698594, .00725332)),
+    ('BarnettChebFit', ((1.6e3, 3.5e4), 'Total H3+ destruction from H3+ +'
+                        ' H2.\n'
+                        'Reference: ATOMIC DATA FOR FUSION VOLUME 1'
+                        ' COLLISIONS OF H, H2, He and Li ATOMS and IONS with'
+                        ' ATOMS and MOLECULES. C. F. Barnett.\n'
+                        'Notes: This corss section is the sum of cross'
+                        ' sections for all reactions that destroy the H3+'
+                        ' molecular ion in passage through H2. Large'
+                        ' variations in ion source operating conditions were'
+                        ' found to produce changes up to 10% in the measured'
+                        ' cross sections.\n'
+                        'Accuracy: 20%.',
+                        3,
+                        (-70.3701, .284601, -.184305, -.0425670, -.00921848,
+                         .00921848, .00698594, .00725332))),
 
     'H2+ + H2 -> H3+ + H':
-    ftc.TabataFit6((1.00e-1, 1.78e1), 'H3+ production from H2+ + H2.\n'
-                   'Reference: The Collected Works of Tatsuo Tabata, Volume'
-                   ' 17, Atomic and Molecular Collision Cross Section (2). T.'
-                   ' Tabata.\n'
-                   'Notes: none.'
-                   'RMS: 1.2%.',
-                   (0.00, 6.05, -5.247e-1, 4.088e-3, 2.872, 7.3e-3, 6.99)),
-}
+    ('TabataFit6', ((1.00e-1, 1.78e1), 'H3+ production from H2+ + H2.\n'
+                    'Reference: The Collected Works of Tatsuo Tabata, Volume'
+                    ' 17, Atomic and Molecular Collision Cross Section (2).'
+                    ' T. Tabata.\n'
+                    'Notes: none.'
+                    'RMS: 1.2%.',
+                    (0.00, 6.05, -5.247e-1, 4.088e-3, 2.872, 7.3e-3, 6.99))),
+})
+
+H3_from_H2_target = LazyFitDict({
+})
 
-H3_from_H2_target = {
+# Single registry of the database dictionaries, indexed by product species
+DB = {
+    'Hp': Hp_from_H2_target,
+    'H': H_from_H2_target,
+    'Hm': Hm_from_H2_target,
+    'H2p': H2p_from_H2_target,
+    'H2': H2_from_H2_target,
+    'H3p': H3p_from_H2_target,
+    'H3': H3_from_H2_target,
 }
+
+
+def _doc_view(database):
+    # Read-only mapping from reaction name to its interned description
+    return MappingProxyType({name: sys.intern(args[1])
+                             for name, (_, args) in database._entries.items()})
+
+
+Hp_from_H2_target_doc = _doc_view(Hp_from_H2_target)
+H_from_H2_target_doc = _doc_view(H_from_H2_target)
+Hm_from_H2_target_doc = _doc_view(Hm_from_H2_target)
+H2p_from_H2_target_doc = _doc_view(H2p_from_H2_target)
+H2_from_H2_target_doc = _doc_view(H2_from_H2_target)
+H3p_from_H2_target_doc = _doc_view(H3p_from_H2_target)
+H3_from_H2_target_doc = _doc_view(H3_from_H2_target)
+
+
+class FitBlock(NamedTuple):
+    """Structure of arrays holding the parameters of every database fit of a
+    given class.
+
+    Attributes
+    ----------
+    ranges : (n, 2) ndarray of float64
+        Domain of each fit, in the units accepted by the constructor of the
+        class.
+
+    params : (n, k) ndarray of float64
+        Constructor arguments following the description of each fit,
+        flattened and padded with zeros to a common length.
+
+    index : dict
+        Mapping from reaction name to row.
+
+    Notes
+    -----
+    Arrays are stored in double precision, so that they hold the exact
+    parameters and domains of the fits, and are cast to the type requested
+    by each batch evaluation.
+
+    """
+    ranges: np.ndarray
+    params: np.ndarray
+    index: dict
+
+
+def _build_blocks(*databases):
+    # Group the raw (class_name, args) entries by fit class
+    entries = {}
+    for database in databases:
+        for name, (class_name, args) in database._entries.items():
+            entries.setdefault(class_name, []).append((name, args))
+    # Stack ranges and parameters of each class into contiguous arrays
+    blocks = {}
+    for class_name, rows in entries.items():
+        params = [np.hstack(args[2:]) for _, args in rows]
+        width = max(row.size for row in params)
+        blocks[class_name] = FitBlock(
+            np.array([args[0] for _, args in rows], dtype=np.float64),
+            np.array([np.pad(row, (0, width - row.size)) for row in params],
+                     dtype=np.float64),
+            {name: i for i, (name, _) in enumerate(rows)})
+    return blocks
+
+
+fit_blocks = _build_blocks(*DB.values())
+
+
+def _member_name(name):
+    # Turn a reaction name into an identifier, e.g. 'H+ + H2 -> total fast H-'
+    # into 'HP_H2_TO_TOTAL_FAST_HM'
+    words = [word.replace('+', 'P').replace('-', 'M').upper()
+             for word in name.replace('->', 'to').split() if word != '+']
+    return '_'.join(words)
+
+
+def _build_reactions(names):
+    # Number the reactions in the given order
+    members = {_member_name(name): value for value, name in enumerate(names)}
+    if len(members) != len(names):
+        raise ValueError('Reaction names must map to unique identifiers')
+    return IntEnum('Reaction', members, module=__name__)
+
+
+def _build_reaction_table(names):
+    # Locate each reaction in fit_blocks
+    locations = {name: (class_name, row)
+                 for class_name, block in fit_blocks.items()
+                 for name, row in block.index.items()}
+    classes = tuple(locations[name][0] for name in names)
+    rows = np.array([locations[name][1] for name in names], dtype=np.intp)
+    # Gather parameters, padded with zeros, and Chebyshev maps
+    width = max((block.params.shape[1] for block in fit_blocks.values()),
+                default=0)
+    params = np.zeros((len(names), width))
+    # Chebyshev maps of every fit class that has one, computed by the class
+    # itself (see `BarnettChebFit.chebyshev_map`)
+    maps = {class_name: fit_class.chebyshev_map(block.ranges, block.params)
+            for class_name, block in fit_blocks.items()
+            for fit_class in [getattr(ftc, class_name)]
+            if hasattr(fit_class, 'chebyshev_map')}
+    log_scale = np.full(len(names), np.nan)
+    log_shift = np.full(len(names), np.nan)
+    for reaction, (class_name, row) in enumerate(zip(classes, rows)):
+        block = fit_blocks[class_name]
+        params[reaction, :block.params.shape[1]] = block.params[row]
+        if class_name in maps:
+            scale, shift = maps[class_name]
+            log_scale[reaction], log_shift[reaction] = scale[row], shift[row]
+    return classes, rows, params, log_scale, log_shift
+
+
+reaction_names = tuple(name for database in DB.values() for name in database)
+Reaction = _build_reactions(reaction_names)
+
+# Flat tables indexed by Reaction: fit class and row in fit_blocks, padded
+# parameters and, for Barnett fits only, the map from ln(E) onto the
+# Chebyshev window (u = ln(E) * scale + shift, NaN for other classes)
+(reaction_class, reaction_row, reaction_params, reaction_log_scale,
+ reaction_log_shift) = _build_reaction_table(reaction_names)
+
+
+def evaluate_rows(class_name, row_indices, energies, dtype=np.float32):
+    """Evaluate several database fits of the same class at once.
+
+    Parameters
+    ----------
+    class_name : string
+        Name of the fit class, i.e. a key of `fit_blocks`.
+
+    row_indices : int_like, (n,) array_like or None
+        Rows of the block to evaluate (see `FitBlock.index`). If None, every
+        fit of the class is evaluated.
+
+    energies : float_like or (m,) array_like (eV)
+        Energies against which to evaluate cross sections.
+
+    dtype : data-type, optional
+        Floating point type in which to carry out the evaluation. Default is
+        np.float32, which halves the memory traffic of large batches, while
+        np.float64 matches the evaluation of the fit objects.
+
+    Returns
+    -------
+    (n, m) ndarray (m^2)
+        Evaluated cross sections, one row per fit. Energies outside the domain
+        of a fit evaluate to NaN.
+
+    """
+    block = fit_blocks[class_name]
+    rows = slice(None) if row_indices is None else np.atleast_1d(row_indices)
+    return getattr(ftc, class_name).evaluate_parameters(block.ranges[rows],
+                                                        block.params[rows],
+                                                        energies, dtype)
+
+
+def evaluate_all(energies, dtype=np.float32):
+    """Evaluate every reaction in the database at once.
+
+    Parameters
+    ----------
+    energies : float_like or (m,) array_like (eV)
+        Energies against which to evaluate cross sections.
+
+    dtype : data-type, optional
+        Floating point type in which to carry out the evaluation. Default is
+        np.float32, which halves the memory traffic of large batches, while
+        np.float64 matches the evaluation of the fit objects.
+
+    Returns
+    -------
+    dict
+        Mapping from reaction name to the (m,) ndarray of evaluated cross
+        sections (m^2). Energies outside the domain of a fit evaluate to NaN.
+
+    Notes
+    -----
+    Each fit class is evaluated by a single call to `evaluate_rows`. Barnett
+    fits sharing a domain are evaluated through one matrix product between
+    their coefficients and the Chebyshev basis of the grid.
+
+    """
+    sigma = {}
+    for class_name, block in fit_blocks.items():
+        sigma.update(zip(block.index,
+                         evaluate_rows(class_name, None, energies, dtype)))
+    return sigma
+
+
+def preload():
+    """Build every fit in the database ahead of its first access.
+
+    Notes
+    -----
+    Fits are otherwise built lazily, on first access, along with the
+    evaluator generated for each of them (`horner{n}` or `clenshaw{n}` for
+    Barnett fits, `tabata{terms}x{powers}` for Tabata fits). Calling this
+    function once, e.g. before forking worker processes or timing a
+    short-lived job, moves that cost out of the first evaluations.
+
+    """
+    for database in DB.values():
+        for _ in database.values():
+            pass
@@ -0,0 +1,67 @@
+"""Tests of the database tables and batch evaluations."""
+import numpy as np
+import database as db
+import fitclasses as ftc
+
+
+def test_reaction_table_matches_fits():
+    for reaction in db.Reaction:
+        fit = next(database[db.reaction_names[reaction]]
+                   for database in db.DB.values()
+                   if db.reaction_names[reaction] in database)
+        if db.reaction_class[reaction] == 'BarnettChebFit':
+            assert db.reaction_log_scale[reaction] == fit._log_scale
+            assert db.reaction_log_shift[reaction] == fit._log_shift
+        else:
+            assert np.isnan(db.reaction_log_scale[reaction])
+            assert np.isnan(db.reaction_log_shift[reaction])
+
+
+def fits():
+    # Every fit of the database, by reaction name
+    return {name: fit for database in db.DB.values()
+            for name, fit in database.items()}
+
+
+def test_evaluate_rows_matches_fits():
+    energies = np.geomspace(1e-2, 1e7, 400)
+    all_fits = fits()
+    for class_name, block in db.fit_blocks.items():
+        names = list(block.index)[::2]
+        sigma = db.evaluate_rows(class_name,
+                                 [block.index[name] for name in names],
+                                 energies, dtype=np.float64)
+        assert sigma.dtype == np.float64
+        expected = ftc.CrossSectionFit.evaluate_batch(
+            [all_fits[name] for name in names], energies)
+        np.testing.assert_allclose(sigma, expected, rtol=1e-10)
+
+
+def test_evaluate_all_defaults_to_single_precision():
+    energies = np.geomspace(1e-2, 1e7, 400)
+    sigma = db.evaluate_all(energies)
+    assert set(sigma) == set(db.reaction_names)
+    expected = db.evaluate_all(energies, dtype=np.float64)
+    for name, row in sigma.items():
+        assert row.dtype == np.float32
+        np.testing.assert_allclose(row, expected[name], rtol=1e-4)
+
+
+def test_lazy_fit_dict_builds_fits_on_access():
+    args = ((1.00e-1, 1.00e4), 'Lazy fit', (0.0, 5.74, -5.765e-1, 2.79e-2,
+                                            1.737))
+    database = db.LazyFitDict({'first': ('TabataFit1', args),
+                               'second': ('TabataFit1', args)})
+    # Membership and iteration do not build any fit
+    assert 'first' in database and list(database) == ['first', 'second']
+    assert all(isinstance(entry, tuple)
+               for entry in database._entries.values())
+    fit = database['first']
+    assert isinstance(fit, ftc.TabataFit1)
+    assert database['first'] is fit
+    assert isinstance(database._entries['second'], tuple)
+    # Other accessors hand out fits only
+    assert all(isinstance(value, ftc.TabataFit1)
+               for value in database.copy().values())
+    assert isinstance(database.pop('second'), ftc.TabataFit1)
+    assert len(database) == 1
@@ -0,0 +1,351 @@
+"""Tests of the fit classes against the plain formulas of their references."""
+import copy
+import pickle
+import numpy as np
+import pytest
+import database as db
+import fitclasses as ftc
+
+
+def barnett_reference(domain, projectile_mass, barnett_coefficients, x):
+    # Barnett's formula, through np.polynomial.Chebyshev and in cm^2
+    coefficients = np.array(barnett_coefficients, dtype=np.float64)
+    coefficients[0] /= 2
+    poly = np.polynomial.Chebyshev(
+        coefficients, domain=np.log(np.array(domain) * projectile_mass))
+    return np.exp(poly(np.log(x))) / 1e4
+
+
+def tabata_f1(x, a1, a2):
+    # Tabata's f1 function, in cm^2
+    return 1e-16 * a1 * np.power(x / 1.361e1, a2)
+
+
+def tabata_f2(x, a1, a2, a3, a4):
+    # Tabata's f2 function, in cm^2
+    return tabata_f1(x, a1, a2) / (1 + np.power(x * 1e-3 / a3, a2 + a4))
+
+
+def tabata_f3(x, a1, a2, a3, a4, a5, a6):
+    # Tabata's f3 function, in cm^2
+    return tabata_f1(x, a1, a2) / (1 + np.power(x * 1e-3 / a3, a2 + a4) +
+                                   np.power(x * 1e-3 / a5, a2 + a6))
+
+
+def tabata_f4(x, a1, a2, a3, a4, a5, a6, a7, a8):
+    # Tabata's f4 function, in cm^2
+    return tabata_f1(x, a1, a2) * (1 + np.power(x * 1e-3 / a3, a4 - a2)) /\
+        (1 + np.power(x * 1e-3 / a5, a4 + a6) +
+         np.power(x * 1e-3 / a7, a4 + a8))
+
+
+# Main expression of each Tabata fit, given E1 and the coefficients, in cm^2
+TABATA_EXPRESSIONS = {
+    'TabataFit1': lambda x, a: tabata_f2(x, *a[0:4]),
+    'TabataFit2': lambda x, a: (tabata_f2(x, *a[0:4]) +
+                                a[4] * tabata_f2(x / a[5], *a[0:4])),
+    'TabataFit3': lambda x, a: tabata_f2(x, *a[0:4]) + tabata_f2(x, *a[4:8]),
+    'TabataFit6': lambda x, a: tabata_f3(x, *a[0:6]),
+    'TabataFit8': lambda x, a: (tabata_f2(x, *a[0:4]) +
+                                tabata_f3(x, a[4], a[1], *a[5:9])),
+    'TabataFit10': lambda x, a: (tabata_f3(x, *a[0:6]) +
+                                 a[6] * tabata_f3(x / a[7], *a[0:6])),
+    'TabataFit11': lambda x, a: tabata_f3(x, *a[0:6]) + tabata_f2(x, *a[6:10]),
+    'TabataFit13': lambda x, a: (tabata_f3(x, *a[0:6]) +
+                                 tabata_f3(x, *a[6:12])),
+    'TabataFit14': lambda x, a: tabata_f4(x, *a[0:8]),
+}
+
+
+def tabata_reference(class_name, tabata_parameters, x):
+    # Tabata's main expression of the given class, in m^2
+    activation_energy, *coefficients = tabata_parameters
+    return TABATA_EXPRESSIONS[class_name](x - activation_energy,
+                                          coefficients) / 1e4
+
+
+def reference(class_name, args, x):
+    # Cross section of a database entry, from the formulas above
+    if class_name == 'BarnettChebFit':
+        domain, _, projectile_mass, coefficients = args
+        return barnett_reference(domain, projectile_mass, coefficients, x)
+    return tabata_reference(class_name, args[2], x)
+
+
+# Raw (class_name, args) entries of the database, which are replaced by the
+# fits once accessed, so they must be gathered before any test runs
+DB_ENTRIES = [entry for database in db.DB.values()
+              for entry in database._entries.values()]
+assert all(isinstance(entry, tuple) for entry in DB_ENTRIES)
+# The database has no TabataFit3 fit, add one
+ENTRIES = DB_ENTRIES + [
+    ('TabataFit3', ((1.0e1, 1.0e5), 'Synthetic fit #3',
+                    (5.0, 2.0e1, 1.5, 2.0, 1.0, 4.0, 1.2, 5.0e1, 5.0e-1)))]
+ENTRY_IDS = [args[1].split('\n')[0] for _, args in ENTRIES]
+
+
+@pytest.mark.parametrize('class_name, args', ENTRIES, ids=ENTRY_IDS)
+def test_fit_matches_reference(class_name, args):
+    fit = getattr(ftc, class_name)(*args)
+    expected = reference(class_name, args, fit.energy_space)
+    np.testing.assert_allclose(fit(), expected, rtol=1e-10)
+    # Single energies are evaluated with the math module instead
+    energy = float(np.sqrt(np.prod(fit.domain)))
+    assert fit(energy) == pytest.approx(
+        float(reference(class_name, args, energy)), rel=1e-10)
+
+
+@pytest.mark.parametrize('class_name, args', ENTRIES, ids=ENTRY_IDS)
+def test_fit_matches_reference_in_single_precision(class_name, args):
+    fit = getattr(ftc, class_name)(*args, dtype=np.float32)
+    expected = reference(class_name, args,
+                         fit.energy_space.astype(np.float64))
+    assert fit().dtype == np.float32
+    np.testing.assert_allclose(fit(), expected, rtol=1e-4)
+
+
+def test_barnett_clenshaw_matches_reference():
+    # More than _horner_max coefficients are evaluated by the Clenshaw
+    # recurrence of the generated evaluator
+    coefficients = (-70.6702, -.632612, -.606521, -.0915143, -.0121710,
+                    .0168179, .0104797, -.00386419, .00167518, -.00092,
+                    .00041, -.00023, .00011)
+    assert len(coefficients) > ftc._horner_max
+    fit = ftc.BarnettChebFit((2.0e3, 1.0e5), 'Clenshaw', 2, coefficients)
+    expected = barnett_reference((2.0e3, 1.0e5), 2, coefficients,
+                                 fit.energy_space)
+    np.testing.assert_allclose(fit(), expected, rtol=1e-12)
+    assert fit._eval.__name__ == f'clenshaw{len(coefficients)}'
+
+
+def test_pickle_keeps_filtered_energy_space():
+    fit = ftc.TabataFit1((1.00e-1, 1.00e4), 'Pickle',
+                         (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    energies = np.array([1e-2, 1.0, 10.0, 1e3, 1e5])
+    fit.energy_space = energies
+    expected = fit().copy()
+    # Changing the assigned array must not change the copies of the fit
+    energies[:] = 1.0
+    for clone in (pickle.loads(pickle.dumps(fit)), copy.deepcopy(fit)):
+        np.testing.assert_array_equal(clone.energy_space, [1.0, 10.0, 1e3])
+        np.testing.assert_array_equal(clone(), expected)
+        assert not clone.energy_space.flags.writeable
+
+
+def test_pickle_regenerates_log_spaced_grid():
+    fit = ftc.BarnettChebFit((2.0e3, 1.0e5), 'Pickle', 2,
+                             (-70.6702, -.632612, -.606521, -.0915143))
+    clone = pickle.loads(pickle.dumps(fit))
+    assert clone.energy_space.base is fit.energy_space.base
+    np.testing.assert_array_equal(clone(), fit())
+    assert repr(clone) == repr(fit)
+
+
+def test_sigma_cache_skips_large_grids():
+    fit = ftc.TabataFit1((1.00e-1, 1.00e4), 'Cache',
+                         (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    small = fit._sigma_cache_nbytes // fit.dtype.itemsize
+    fit(small)
+    fit(small + 1)
+    fit(np.linspace(1.0, 2.0, small + 1))
+    assert list(fit._sigma_cache) == [small]
+
+
+def test_energy_space_copies_read_only_arrays():
+    fit = ftc.TabataFit1((1.00e-1, 1.00e4), 'Copy',
+                         (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    energies = np.array([1.0, 10.0, 1e3])
+    energies.setflags(write=False)
+    fit.energy_space = energies
+    expected = fit().copy()
+    # The owner of a read-only array can make it writable again
+    energies.setflags(write=True)
+    energies[:] = 2.0
+    np.testing.assert_array_equal(fit.energy_space, [1.0, 10.0, 1e3])
+    np.testing.assert_array_equal(fit(fit.energy_space), expected)
+
+
+def test_energy_space_shares_fit_energy_spaces():
+    first = ftc.TabataFit1((1.00e-1, 1.00e4), 'Share',
+                           (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    second = ftc.TabataFit1((1.00e-1, 1.00e4), 'Share',
+                            (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    second.energy_space = first.energy_space
+    assert np.shares_memory(second.energy_space, first.energy_space)
+    first.energy_space = np.array([1.0, 10.0, 1e3])
+    second.energy_space = first.energy_space
+    assert second.energy_space is first.energy_space
+
+
+def allowed_reference(energies, domain):
+    # Energies within the domain boundaries, through the plain mask
+    lo, hi = domain
+    allowed = energies[(energies >= lo) & (energies <= hi)]
+    return allowed if allowed.size else np.nan
+
+
+GRID = np.geomspace(1e-3, 1e6, 64)
+ALLOWED_INPUTS = {
+    'sorted': GRID,
+    'reversed': GRID[::-1],
+    'unsorted': np.random.default_rng(0).permutation(GRID),
+    'nan inside': np.array([1.0, np.nan, 1e2, 1e3]),
+    'nan at the ends': np.array([np.nan, 1.0, 1e2, np.nan]),
+    'nan outside': np.concatenate([GRID[:8], [np.nan], GRID[8:]]),
+    'straddling the minimum': np.geomspace(1e-3, 1e2, 16),
+    'straddling the maximum': np.geomspace(1e2, 1e6, 16),
+    'boundaries': np.array([1.00e-1, 1.00e4]),
+    'straddling the boundaries': np.array([1e-2, 1.00e-1, 1.0, 1.00e4, 1e5]),
+    'outside': np.array([1e5, 1e-2, 1e6]),
+    'empty': np.array([]),
+}
+
+
+@pytest.mark.parametrize('energies', ALLOWED_INPUTS.values(),
+                         ids=ALLOWED_INPUTS.keys())
+def test_allowed_energies_matches_mask(energies):
+    fit = ftc.TabataFit1((1.00e-1, 1.00e4), 'Allowed',
+                         (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    expected = allowed_reference(energies, fit.domain)
+    for copied in (True, False):
+        allowed = fit._allowed_energies(energies, copied)
+        np.testing.assert_array_equal(allowed, expected)
+        if copied and isinstance(allowed, np.ndarray):
+            assert not np.shares_memory(allowed, energies)
+
+
+@pytest.mark.parametrize('energies', [np.geomspace(1.0, 1e3, 16),
+                                      np.geomspace(1e3, 1.0, 16),
+                                      np.array([1e2, 1.0, 1e3, 10.0])],
+                         ids=['sorted', 'reversed', 'unsorted'])
+def test_allowed_energies_keeps_arrays_in_domain(energies):
+    fit = ftc.TabataFit1((1.00e-1, 1.00e4), 'Allowed',
+                         (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    # Arrays entirely in the domain are returned as they are, or copied
+    assert fit._allowed_energies(energies, copy=False) is energies
+    allowed = fit._allowed_energies(energies)
+    assert allowed is not energies
+    np.testing.assert_array_equal(allowed, energies)
+
+
+@pytest.mark.parametrize('energy, expected',
+                         [(1.00e-1, 1.00e-1), (1e2, 1e2), (1.00e4, 1.00e4),
+                          (1e-2, np.nan), (1e5, np.nan), (np.nan, np.nan)])
+def test_allowed_energies_checks_scalars(energy, expected):
+    fit = ftc.TabataFit1((1.00e-1, 1.00e4), 'Allowed',
+                         (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737))
+    allowed = fit._allowed_energies(np.array(energy))
+    assert isinstance(allowed, float)
+    np.testing.assert_array_equal(allowed, expected)
+
+
+def test_grid_views_match_fresh_arrays():
+    # A grid long enough for the views within the domain of the Barnett fit
+    # to exceed _block_size, so that their sortedness is not scanned
+    wide = ftc.TabataFit1((1.00e-1, 1.00e6), 'Grid',
+                          (0.0, 5.74, -5.765e-1, 2.79e-2, 1.737),
+                          energy_space=200000)
+    grid = wide.energy_space
+    args = ((2.0e3, 1.0e5), 'View', 2,
+            (-70.6702, -.632612, -.606521, -.0915143))
+    # Each fit has its own cross section cache, so the second one evaluates
+    # the fresh arrays instead of finding the cross sections of the views
+    fit, other = ftc.BarnettChebFit(*args), ftc.BarnettChebFit(*args)
+    assert allowed_reference(grid, fit.domain).size > ftc._block_size
+    for view in (grid, grid[::3], grid[::-1], grid[150000:]):
+        fit.energy_space = view
+        np.testing.assert_array_equal(
+            fit.energy_space, allowed_reference(view, fit.domain))
+        if view.strides[0] > 0:
+            # Forward views keep pointing into the grid, with its logarithm
+            assert np.shares_memory(fit.energy_space, grid)
+            assert np.shares_memory(fit._log_energy_space, grid.base)
+        fresh = np.array(fit.energy_space)
+        np.testing.assert_allclose(fit(), other(fresh), rtol=1e-13)
+
+
+# Tabata fits with coefficients dividing E1 that are zero, or negative with
+# an integral exponent, whose powers are real
+NON_POSITIVE_DIVISORS = [
+    ('TabataFit1', (0.0, 5.74, 1.0, -2.0e-2, 1.0)),
+    ('TabataFit1', (0.0, 5.74, 1.5, -1.0e2, 1.5)),
+    ('TabataFit1', (0.0, 5.74, 1.0, 0.0, 1.0)),
+    ('TabataFit1', (0.0, 5.74, 1.0, 0.0, -2.5)),
+    ('TabataFit2', (0.0, 5.74, 1.0, 2.0e-2, 1.0, -5.0e-1, -2.0)),
+    ('TabataFit6', (0.0, 5.74, 1.0, 2.0e-2, 1.0, -1.0e2, 2.0)),
+    ('TabataFit14', (0.0, 5.74, 1.0, -3.0e-2, 3.0, 1.0e1, 1.0, 2.0e1, 1.0)),
+]
+
+
+@pytest.mark.parametrize('class_name, tabata_parameters',
+                         NON_POSITIVE_DIVISORS)
+def test_tabata_accepts_non_positive_divisors(class_name, tabata_parameters):
+    fit = getattr(ftc, class_name)((1.00e-1, 1.00e4), 'Divisor',
+                                   tabata_parameters)
+    with np.errstate(divide='ignore'):
+        expected = tabata_reference(class_name, tabata_parameters,
+                                    fit.energy_space)
+        expected_scalar = tabata_reference(class_name, tabata_parameters,
+                                           np.float64(1e2))
+    np.testing.assert_allclose(fit(), expected, rtol=1e-10)
+    np.testing.assert_allclose(
+        ftc.CrossSectionFit.evaluate_batch([fit], fit.energy_space)[0],
+        expected, rtol=1e-10)
+    assert fit(1e2) == pytest.approx(float(expected_scalar), rel=1e-10)
+
+
+@pytest.mark.parametrize('class_name, tabata_parameters', [
+    ('TabataFit1', (0.0, 5.74, 1.0, -2.0e-2, 1.5)),
+    ('TabataFit2', (0.0, 5.74, 1.5, 2.0e-2, 1.0, 5.0e-1, -2.0)),
+    ('TabataFit14', (0.0, 5.74, 1.0, 3.0e-2, 3.0, 1.0e1, 1.0, -2.0e1, 1.5)),
+])
+def test_tabata_rejects_negative_divisors_of_real_powers(class_name,
+                                                         tabata_parameters):
+    with pytest.raises(ValueError, match='Tabata coefficient'):
+        getattr(ftc, class_name)((1.00e-1, 1.00e4), 'Divisor',
+                                 tabata_parameters)
+    # Batch evaluations do not check coefficients, and give NaN instead
+    sigma = getattr(ftc, class_name).evaluate_parameters(
+        np.array([[1.00e-1, 1.00e4]]), np.array([tabata_parameters]),
+        np.array([1.0, 1e2, 1e3]))
+    assert np.isnan(sigma).all()
+
+
+def test_evaluate_batch_matches_fits():
+    fits = [getattr(ftc, class_name)(*args)
+            for class_name, args in DB_ENTRIES]
+    energies = np.geomspace(1e-2, 1e7, 400)
+    sigma = ftc.CrossSectionFit.evaluate_batch(fits, energies)
+    assert sigma.shape == (len(fits), energies.size)
+    for row, fit in zip(sigma, fits):
+        lo, hi = fit.domain
+        inside = (energies >= lo) & (energies <= hi)
+        assert np.isnan(row[~inside]).all()
+        np.testing.assert_allclose(row[inside], fit(energies[inside]),
+                                   rtol=1e-10)
+
+
+def test_evaluate_batch_rejects_empty_collections():
+    with pytest.raises(ValueError):
+        ftc.CrossSectionFit.evaluate_batch([], 1e3)
+
+
+def test_evaluate_fits_rejects_other_classes():
+    fits = [getattr(ftc, class_name)(*args)
+            for class_name, args in DB_ENTRIES]
+    with pytest.raises(TypeError):
+        ftc.BarnettChebFit.evaluate_fits(fits, 1e3)
+
+
+def test_to_interpolator_matches_fit():
+    pytest.importorskip('scipy')
+    fit = ftc.BarnettChebFit((2.0e3, 1.0e5), 'Interpolator', 2,
+                             (-70.6702, -.632612, -.606521, -.0915143,
+                              -.0121710, .0168179, .0104797))
+    interpolator = fit.to_interpolator()
+    np.testing.assert_allclose(
+        np.exp(interpolator(np.log(fit.energy_space))), fit(), rtol=1e-12)
+    middle = np.sqrt(fit.energy_space[1:] * fit.energy_space[:-1])
+    np.testing.assert_allclose(np.exp(interpolator(np.log(middle))),
+                               fit(middle), rtol=1e-5)
+    assert np.isnan(interpolator(np.log(fit.domain[0] / 2)))